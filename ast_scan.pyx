@@ -0,0 +1,117 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled scanners for port_en_to_jp_3.py.
+Build in place with:  pip install cython && cythonize -i ast_scan.pyx
+When the module is built the porter uses these instead of its pure-Python
+find_matching_brace() and transform_names(); results are identical.
+"""
+
+cdef enum:
+    QUOTE = 34       # '"'
+    EQUALS = 61      # '='
+    BACKSLASH = 92   # '\\'
+    OPEN_BRACE = 123   # '{'
+    CLOSE_BRACE = 125  # '}'
+
+
+cdef inline bint _is_space(unsigned char c) nogil:
+    # Same set as bytes.isspace(): ' ', \t, \n, \v, \f, \r
+    return c == 32 or 9 <= c <= 13
+
+
+cdef Py_ssize_t _match_brace(const unsigned char[:] buf, Py_ssize_t start, Py_ssize_t end) nogil:
+    """Position after the brace matching buf[start], considering buf[:end]; -1 if none."""
+    cdef Py_ssize_t depth = 1
+    cdef Py_ssize_t i = start + 1
+    cdef unsigned char c
+    while i < end:
+        c = buf[i]
+        # Skip escaped braces
+        if (c == OPEN_BRACE or c == CLOSE_BRACE) and buf[i-1] != BACKSLASH:
+            if c == OPEN_BRACE:
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return i + 1
+        i += 1
+    return -1
+
+
+cdef Py_ssize_t _find_name(const unsigned char[:] buf, Py_ssize_t i, Py_ssize_t n) nogil:
+    """Position of the next case-insensitive 'name' at or after i; -1 if none."""
+    # OR-ing 0x20 folds only A-Z onto a-z for these four letters
+    while i + 4 <= n:
+        if ((buf[i] | 0x20) == 110 and (buf[i+1] | 0x20) == 97
+                and (buf[i+2] | 0x20) == 109 and (buf[i+3] | 0x20) == 101):
+            return i
+        i += 1
+    return -1
+
+
+cdef Py_ssize_t _rfind_quote(const unsigned char[:] buf, Py_ssize_t start, Py_ssize_t end) nogil:
+    """Position of the last unescaped '"' in buf[start:end]; -1 if none."""
+    cdef Py_ssize_t pos = end - 1
+    cdef Py_ssize_t backslashes
+    while pos >= start:
+        if buf[pos] == QUOTE:
+            # A quote preceded by an odd run of backslashes is escaped
+            backslashes = 0
+            while pos - backslashes - 1 >= start and buf[pos - backslashes - 1] == BACKSLASH:
+                backslashes += 1
+            if backslashes % 2 == 0:
+                return pos
+        pos -= 1
+    return -1
+
+
+def find_matching_brace(text, Py_ssize_t start_idx, end_idx=None):
+    """Find position after matching closing brace with proper nesting."""
+    cdef const unsigned char[:] buf = text
+    cdef Py_ssize_t n = buf.shape[0]
+    cdef Py_ssize_t end = n
+    if start_idx < 0 or start_idx >= n or buf[start_idx] != OPEN_BRACE:
+        return -1
+    if end_idx is not None and end_idx < n:
+        end = end_idx
+    return _match_brace(buf, start_idx, end)
+
+
+def transform_names(bytes en_content):
+    """Reduce every name = { ... } array to its last quoted string."""
+    cdef const unsigned char[:] buf = en_content
+    cdef Py_ssize_t n = buf.shape[0]
+    cdef Py_ssize_t i, j, end, open_quote, close_quote
+    cdef Py_ssize_t last_pos = 0
+    parts = []
+
+    i = _find_name(buf, 0, n)
+    while i != -1:
+        # Expect optional whitespace, '=', optional whitespace, '{'
+        end = -1
+        j = i + 4
+        while j < n and _is_space(buf[j]):
+            j += 1
+        if j < n and buf[j] == EQUALS:
+            j += 1
+            while j < n and _is_space(buf[j]):
+                j += 1
+            if j < n and buf[j] == OPEN_BRACE:
+                end = _match_brace(buf, j, n)
+        if end == -1:
+            i = _find_name(buf, i + 4, n)
+            continue
+
+        # Keep only the last quoted string between the braces
+        close_quote = _rfind_quote(buf, j + 1, end - 1)
+        open_quote = _rfind_quote(buf, j + 1, close_quote) if close_quote != -1 else -1
+        if open_quote != -1:
+            parts.append(en_content[last_pos:j + 1])
+            parts.append(en_content[open_quote:close_quote + 1])
+            last_pos = end - 1
+        i = _find_name(buf, end, n)
+
+    if not parts:
+        return en_content
+    parts.append(en_content[last_pos:])
+    return b''.join(parts)
@@ -8,270 +8,394 @@ Correctly handles block numbering offset:
   • Mapping: block_00000 (TO) ↔ ["0001_00001"] (FROM)
 Preserves 100% of game structure - ONLY modifies text/ja sections.
 """
+import codecs
+import mmap
+import os
 import re
 import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict
+from typing import Iterator, List, Tuple, Optional
+
+# Compiled brace/name scanners; build with: cythonize -i ast_scan.pyx
+try:
+    import ast_scan as _ast_scan
+except ImportError:
+    _ast_scan = None
+
+# Patterns are compiled once at import; they run per block for every file.
+# Files are scanned as raw UTF-8 bytes, so the patterns are bytes too.
+_BLOCK_TO_RE = re.compile(rb'block_(\d+)\s*=\s*\{', re.IGNORECASE)
+_BLOCK_FROM_RE = re.compile(rb'\["\d+_(\d+)"\]\s*=\s*\{', re.IGNORECASE)
+_TEXT_RE = re.compile(rb'text\s*=\s*\{', re.IGNORECASE)
+_JA_RE = re.compile(rb'ja\s*=\s*\{', re.IGNORECASE)
+_EN_RE = re.compile(rb'en\s*=\s*\{', re.IGNORECASE)
+_NAME_RE = re.compile(rb'(name\s*=\s*\{)(.*?)(\})', re.DOTALL | re.IGNORECASE)
+_QSTR_RE = re.compile(rb'"(?:[^"\\]|\\.)*"')
+
+# Set AST_NAME_REGEX=1 to rewrite name fields with the old regex path, for
+# comparing output against transform_names()
+_NAME_REGEX_FALLBACK = os.environ.get('AST_NAME_REGEX') == '1'
+
+_LINESEP = os.linesep.encode()
+_UTF8_CHECK_CHUNK = 1 << 20  # Bytes validated per step by _check_utf8()
+_OPEN_BRACE = ord('{')
+_WHITESPACE = frozenset(b' \t\n\r\f\v')
+_BACKSLASH = ord('\\')
+
+# Per-file status lines are written in batches of this many files
+LOG_FLUSH_INTERVAL = 64
+
+# (filename, success, mismatch, error_msg, traceback) returned by process_file;
+# mismatch is (to_count, from_count, unmatched_to, unmatched_from) or None
+FileResult = Tuple[str, bool, Optional[Tuple[int, int, List[int], List[int]]], Optional[str], Optional[str]]
 
 class ASTBlock:
-    def __init__(self, start: int, end: int, content: str, block_id: int, raw_header: str):
+    # Blocks hold offsets into the file buffer rather than a copy of their text
+    __slots__ = ('start', 'end', 'block_id', 'text_span')
+    
+    def __init__(self, start: int, end: int, block_id: int,
+                 text_span: Optional[Tuple[int, int]] = None):
         self.start = start
         self.end = end
-        self.content = content
         self.block_id = block_id  # Numeric ID (00000 for block_00000, 00001 for ["0001_00001"], etc.)
-        self.raw_header = raw_header  # Original header text (for reconstruction)
+        self.text_span = text_span  # Span of the 'text = {' header in the file buffer, if any
 
 class ASTProcessor:
     def __init__(self):
         self.mismatched_files: List[Tuple[str, int, int, List[int]]] = []  # (filename, to_count, from_count, unmatched_ids)
         self.failed_files: List[Tuple[str, str]] = []  # (filename, error_msg)
         self.successful_files: List[str] = []
+        self.log_lines: List[str] = []  # Per-file status output, written by flush_log()
 
-    def find_matching_brace(self, text: str, start_idx: int) -> int:
-        """Find position after matching closing brace with proper nesting."""
-        if start_idx >= len(text) or text[start_idx] != '{':
+    def find_matching_brace(self, text: bytes, start_idx: int, end_idx: Optional[int] = None) -> int:
+        """Find position after matching closing brace with proper nesting.
+        
+        If end_idx is given, only braces before it are considered.
+        """
+        if start_idx >= len(text) or text[start_idx] != _OPEN_BRACE:
             return -1
+        if end_idx is None:
+            end_idx = len(text)
         
+        # Jump between delimiters with find() instead of stepping per character
         depth = 1
         i = start_idx + 1
-        while i < len(text) and depth > 0:
+        while depth > 0:
+            close_pos = text.find(b'}', i, end_idx)
+            if close_pos == -1:
+                return -1
+            open_pos = text.find(b'{', i, close_pos)
+            next_pos = close_pos if open_pos == -1 else open_pos
             # Skip escaped braces
-            if i > 0 and text[i-1] == '\\':
-                i += 1
+            if text[next_pos-1] == _BACKSLASH:
+                i = next_pos + 1
                 continue
-            if text[i] == '{':
-                depth += 1
-            elif text[i] == '}':
-                depth -= 1
-            i += 1
+            depth += 1 if next_pos == open_pos else -1
+            i = next_pos + 1
         
-        return i if depth == 0 else -1
+        return i
 
-    def extract_blocks_to(self, content: str) -> List[ASTBlock]:
-        """Extract blocks from TO file (block_00000 format)."""
+    def _extract_blocks(self, content: bytes, header_re: re.Pattern) -> List[ASTBlock]:
+        """Extract top-level blocks whose headers match header_re, in a single pass."""
         blocks = []
-        pos = 0
-        block_pattern = r'block_(\d+)\s*=\s*\{'
+        pos = 0  # End of the last extracted block
         
-        while pos < len(content):
-            match = re.search(block_pattern, content[pos:], re.IGNORECASE)
-            if not match:
-                break
+        for match in header_re.finditer(content):
+            # Skip headers nested inside a block we already extracted
+            if match.start() < pos:
+                continue
             
-            abs_start = pos + match.start()
+            abs_start = match.start()
             block_id = int(match.group(1))
-            brace_pos = pos + match.end() - 1  # Position of '{'
+            brace_pos = match.end() - 1  # Position of '{'
             
             # Find matching closing brace for the entire block
             end_pos = self.find_matching_brace(content, brace_pos)
             if end_pos == -1:
-                pos += match.end()
                 continue
             
-            # Extract full block content including header
-            header_end = pos + match.end()
-            full_block = content[abs_start:end_pos]
-            blocks.append(ASTBlock(abs_start, end_pos, full_block, block_id, match.group(0)))
+            # Locate 'text = {' once while the block bounds are at hand
+            text_match = _TEXT_RE.search(content, abs_start, end_pos)
+            text_span = text_match.span() if text_match else None
+            
+            blocks.append(ASTBlock(abs_start, end_pos, block_id, text_span))
             pos = end_pos
         
         return blocks
 
-    def extract_blocks_from(self, content: str) -> List[ASTBlock]:
+    def extract_blocks_to(self, content: bytes) -> List[ASTBlock]:
+        """Extract blocks from TO file (block_00000 format)."""
+        return self._extract_blocks(content, _BLOCK_TO_RE)
+
+    def extract_blocks_from(self, content: bytes) -> List[ASTBlock]:
         """Extract blocks from FROM file (["0001_00001"] format)."""
-        blocks = []
-        pos = 0
-        block_pattern = r'\["\d+_(\d+)"\]\s*=\s*\{'
-        
-        while pos < len(content):
-            match = re.search(block_pattern, content[pos:], re.IGNORECASE)
-            if not match:
-                break
-            
-            abs_start = pos + match.start()
-            block_id = int(match.group(1))
-            brace_pos = pos + match.end() - 1  # Position of '{'
-            
-            # Find matching closing brace for the entire block
-            end_pos = self.find_matching_brace(content, brace_pos)
-            if end_pos == -1:
-                pos += match.end()
-                continue
-            
-            # Extract full block content including header
-            header_end = pos + match.end()
-            full_block = content[abs_start:end_pos]
-            blocks.append(ASTBlock(abs_start, end_pos, full_block, block_id, match.group(0)))
-            pos = end_pos
-        
-        return blocks
+        return self._extract_blocks(content, _BLOCK_FROM_RE)
 
-    def extract_ja_section(self, block_content: str) -> Optional[Tuple[int, int, str]]:
-        """Extract ja = { ... } subsection from block's text section."""
-        # Find 'text = {' first
-        text_match = re.search(r'text\s*=\s*\{', block_content, re.IGNORECASE)
-        if not text_match:
+    def _find_text_subsection(self, buf: bytes, block: ASTBlock, key_re: re.Pattern) -> Optional[Tuple[int, int]]:
+        """Find the span in buf of a key = { ... } subsection inside the block's text section."""
+        # 'text = {' was located when the block was extracted
+        if not block.text_span:
             return None
+        text_brace = block.text_span[1] - 1
         
-        text_start = text_match.start()
-        brace_pos = text_match.end() - 1
-        text_end = self.find_matching_brace(block_content, brace_pos)
-        if text_end == -1:
+        # Search straight on from the text header instead of bounding the
+        # whole text section first; only the gap up to the key is walked to
+        # confirm the text section is still open there
+        key_match = key_re.search(buf, text_brace + 1, block.end)
+        if not key_match:
             return None
         
-        text_section = block_content[text_start:text_end]
+        key_start = key_match.start()
+        if self.find_matching_brace(buf, text_brace, key_start) != -1:
+            return None  # Text section closed before the key
         
-        # Find 'ja = {' inside text section
-        ja_match = re.search(r'ja\s*=\s*\{', text_section, re.IGNORECASE)
-        if not ja_match:
+        key_end = self.find_matching_brace(buf, key_match.end() - 1, block.end)
+        if key_end == -1:
             return None
         
-        ja_start_in_section = ja_match.start()
-        brace_pos = ja_match.end() - 1
-        ja_end_in_section = self.find_matching_brace(text_section, brace_pos)
-        if ja_end_in_section == -1:
+        return (key_start, key_end)
+
+    def extract_ja_section(self, buf: bytes, block: ASTBlock) -> Optional[Tuple[int, int, bytes]]:
+        """Extract ja = { ... } subsection from block's text section (offsets into buf)."""
+        span = self._find_text_subsection(buf, block, _JA_RE)
+        if not span:
             return None
         
-        ja_content = text_section[ja_start_in_section:ja_end_in_section]
-        abs_start = text_start + ja_start_in_section
-        abs_end = text_start + ja_end_in_section
-        
-        return (abs_start, abs_end, ja_content)
+        ja_start, ja_end = span
+        return (ja_start, ja_end, buf[ja_start:ja_end])
 
-    def extract_en_section(self, block_content: str) -> Optional[str]:
+    def extract_en_section(self, buf: bytes, block: ASTBlock) -> Optional[bytes]:
         """Extract and transform en = { ... } subsection from FROM block."""
-        # Find 'text = {' first
-        text_match = re.search(r'text\s*=\s*\{', block_content, re.IGNORECASE)
-        if not text_match:
+        span = self._find_text_subsection(buf, block, _EN_RE)
+        if not span:
             return None
         
-        text_start = text_match.start()
-        brace_pos = text_match.end() - 1
-        text_end = self.find_matching_brace(block_content, brace_pos)
-        if text_end == -1:
-            return None
+        en_content = buf[span[0]:span[1]]
         
-        text_section = block_content[text_start:text_end]
+        # Transform name fields: keep only last element (English name)
+        if _NAME_REGEX_FALLBACK:
+            en_content = _NAME_RE.sub(self._transform_name_match, en_content)
+        else:
+            en_content = self.transform_names(en_content)
         
-        # Find 'en = {' inside text section
-        en_match = re.search(r'en\s*=\s*\{', text_section, re.IGNORECASE)
-        if not en_match:
-            return None
+        # Change 'en =' to 'ja =' at start; the section was matched by _EN_RE,
+        # so the first '=' is the one after the key
+        en_content = b'ja =' + en_content[en_content.index(b'=') + 1:]
+        return en_content
+
+    def _pair_blocks(self, to_blocks: List[ASTBlock], from_blocks: List[ASTBlock]
+                     ) -> Tuple[List[Tuple[ASTBlock, Optional[ASTBlock]]], List[int]]:
+        """Pair TO block N with FROM block N+1.
         
-        en_start = en_match.start()
-        brace_pos = en_match.end() - 1
-        en_end = self.find_matching_brace(text_section, brace_pos)
-        if en_end == -1:
-            return None
+        Returns (matches, unmatched_from_ids). matches holds each TO block with
+        its FROM partner, or None if there is none. Repeated ids keep their
+        last block; both lists follow file order.
+        """
+        # Fast path: well-formed files have the same block count on both sides,
+        # ids strictly increasing and every FROM id one ahead of its TO block,
+        # so pair by index. Repeated ids must take the dicts for last-wins.
+        if len(to_blocks) == len(from_blocks):
+            prev_id = -1
+            for t, f in zip(to_blocks, from_blocks):
+                if t.block_id <= prev_id or t.block_id + 1 != f.block_id:
+                    break
+                prev_id = t.block_id
+            else:
+                return list(zip(to_blocks, from_blocks)), []
         
-        en_content = text_section[en_start:en_end]
+        # Create lookup dictionaries by block ID
+        to_blocks_dict = {b.block_id: b for b in to_blocks}
+        from_blocks_dict = {b.block_id: b for b in from_blocks}
         
-        # Transform name fields: keep only last element (English name)
-        def transform_name(match):
-            # Extract all quoted strings in the array
-            strings = re.findall(r'"(?:[^"\\]|\\.)*"', match.group(2))
-            if strings:
-                return f'{match.group(1)}{strings[-1]}{match.group(3)}'
-            return match.group(0)
+        matches = [(to_block, from_blocks_dict.get(to_id + 1))  # Offset correction
+                   for to_id, to_block in to_blocks_dict.items()]
+        unmatched_from = [from_id for from_id in from_blocks_dict
+                          if (from_id - 1) not in to_blocks_dict]
+        return matches, unmatched_from
+
+    def _transform_name_match(self, match) -> bytes:
+        """Regex callback for _NAME_RE: keep only the last quoted string."""
+        # Extract all quoted strings in the array
+        strings = _QSTR_RE.findall(match.group(2))
+        if strings:
+            return match.group(1) + strings[-1] + match.group(3)
+        return match.group(0)
+
+    def _rfind_quote(self, text: bytes, start: int, end: int) -> int:
+        """Find the last unescaped '"' in text[start:end], or -1."""
+        pos = end
+        while True:
+            pos = text.rfind(b'"', start, pos)
+            if pos == -1:
+                return -1
+            # A quote preceded by an odd run of backslashes is escaped
+            backslashes = 0
+            while pos - backslashes - 1 >= start and text[pos - backslashes - 1] == _BACKSLASH:
+                backslashes += 1
+            if backslashes % 2 == 0:
+                return pos
+
+    def transform_names(self, en_content: bytes) -> bytes:
+        """Reduce every name = { ... } array to its last quoted string.
         
-        en_content = re.sub(
-            r'(name\s*=\s*\{)(.*?)(\})',
-            transform_name,
-            en_content,
-            flags=re.DOTALL | re.IGNORECASE
-        )
+        {"遥斗", "Haruto"} → {"Haruto"}; arrays without quoted strings are
+        left as they are.
+        """
+        parts = []
+        last_pos = 0
+        # Keys match case-insensitively; ASCII lower() keeps byte offsets
+        lowered = en_content.lower()
+        i = lowered.find(b'name')
+        while i != -1:
+            # Expect optional whitespace, '=', optional whitespace, '{'
+            j = i + 4
+            while j < len(en_content) and en_content[j] in _WHITESPACE:
+                j += 1
+            if en_content[j:j+1] == b'=':
+                j += 1
+                while j < len(en_content) and en_content[j] in _WHITESPACE:
+                    j += 1
+            else:
+                j = -1
+            
+            end = self.find_matching_brace(en_content, j) if j != -1 else -1
+            if end == -1:
+                i = lowered.find(b'name', i + 4)
+                continue
+            
+            # Keep only the last quoted string between the braces
+            close_quote = self._rfind_quote(en_content, j + 1, end - 1)
+            open_quote = self._rfind_quote(en_content, j + 1, close_quote) if close_quote != -1 else -1
+            if open_quote != -1:
+                parts.append(en_content[last_pos:j + 1])
+                parts.append(en_content[open_quote:close_quote + 1])
+                last_pos = end - 1
+            i = lowered.find(b'name', end)
         
-        # Change 'en =' to 'ja =' at start
-        en_content = re.sub(r'^en\s*=', 'ja =', en_content, count=1, flags=re.IGNORECASE)
-        return en_content
+        if not parts:
+            return en_content
+        parts.append(en_content[last_pos:])
+        return b''.join(parts)
 
-    def process_file(self, to_path: Path, from_path: Path, out_path: Path) -> bool:
-        """Process a single file pair with block-aware matching."""
+    def process_file(self, to_path: Path, from_path: Path, out_path: Path) -> FileResult:
+        """Process a single file pair with block-aware matching.
+        
+        Does not touch the processor's report lists, so it can run in a
+        worker process; pass the returned tuple to record() to aggregate it.
+        """
+        mismatch = None
         try:
-            # Read files with UTF-8 encoding
-            to_content = to_path.read_text(encoding='utf-8')
-            from_content = from_path.read_text(encoding='utf-8')
-            
-            # Extract blocks from both files
-            to_blocks = self.extract_blocks_to(to_content)
-            from_blocks = self.extract_blocks_from(from_content)
-            
-            if not to_blocks:
-                self.failed_files.append((to_path.name, "No blocks found in TO file"))
-                return False
-            
-            if not from_blocks:
-                self.failed_files.append((to_path.name, "No blocks found in FROM file"))
-                return False
-            
-            # Create lookup dictionaries by block ID
-            to_blocks_dict = {b.block_id: b for b in to_blocks}
-            from_blocks_dict = {b.block_id: b for b in from_blocks}
-            
-            # Match blocks: TO block_id N ↔ FROM block_id N+1
-            # Example: block_00000 (ID=0) ↔ ["0001_00001"] (ID=1)
-            replacements = {}
-            unmatched_to = []
-            unmatched_from = []
-            
-            for to_id, to_block in to_blocks_dict.items():
-                from_id = to_id + 1  # Offset correction
-                if from_id in from_blocks_dict:
-                    en_section = self.extract_en_section(from_blocks_dict[from_id].content)
+            # Map both files; only the pages the scans touch are read in
+            with _mapped(to_path) as to_content, _mapped(from_path) as from_content:
+                # Reject invalid UTF-8 as the old text-mode reads did
+                _check_utf8(to_content)
+                _check_utf8(from_content)
+                
+                # Safety check: verify basic AST structure up front. Replacements
+                # only touch ja sections inside blocks, which come after the
+                # header, so the output keeps whatever the TO file has here.
+                # The limits are in characters of newline-translated text, as
+                # the old str check had them; 300 characters fit in 1200 bytes.
+                head = to_content[:1200].decode('utf-8', 'ignore').replace('\r\n', '\n')
+                if head.find('astver', 0, 200) == -1 or head.find('ast = {', 0, 300) == -1:
+                    return (to_path.name, False, None, "CRITICAL: TO file structure not recognized (missing astver/ast)", None)
+                
+                # Nothing can be replaced without a ja section to overwrite and an
+                # en section to copy; a single scan is far cheaper than parsing blocks
+                if not _JA_RE.search(to_content):
+                    return (to_path.name, False, None, "No ja section found in TO file", None)
+                if not _EN_RE.search(from_content):
+                    return (to_path.name, False, None, "No en section found in FROM file", None)
+                
+                to_blocks = self.extract_blocks_to(to_content)
+                from_blocks = self.extract_blocks_from(from_content)
+                
+                if not to_blocks:
+                    return (to_path.name, False, None, "No blocks found in TO file", None)
+                
+                if not from_blocks:
+                    return (to_path.name, False, None, "No blocks found in FROM file", None)
+                
+                # Match blocks: TO block_id N ↔ FROM block_id N+1
+                # Example: block_00000 (ID=0) ↔ ["0001_00001"] (ID=1)
+                matches, unmatched_from = self._pair_blocks(to_blocks, from_blocks)
+                
+                replacements = {}
+                unmatched_to = []
+                for to_block, from_block in matches:
+                    if from_block is None:
+                        unmatched_to.append(to_block.block_id)
+                        continue
+                    en_section = self.extract_en_section(from_content, from_block)
                     if en_section:
-                        ja_pos = self.extract_ja_section(to_block.content)
+                        ja_pos = self.extract_ja_section(to_content, to_block)
                         if ja_pos:
-                            replacements[to_block.start + ja_pos[0]] = (to_block.start + ja_pos[1], en_section)
+                            replacements[ja_pos[0]] = (ja_pos[1], en_section)
                         else:
-                            unmatched_to.append(to_id)
-                else:
-                    unmatched_to.append(to_id)
-            
-            for from_id in from_blocks_dict:
-                if (from_id - 1) not in to_blocks_dict:
-                    unmatched_from.append(from_id)
-            
-            # Report mismatches if any
-            if unmatched_to or unmatched_from:
-                self.mismatched_files.append((
-                    to_path.name,
-                    len(to_blocks),
-                    len(from_blocks),
-                    unmatched_to + unmatched_from
-                ))
-                print(f"  ⚠ Block mismatch: {len(unmatched_to)} TO blocks unmatched, {len(unmatched_from)} FROM blocks unmatched")
-            
-            if not replacements:
-                self.failed_files.append((to_path.name, "No valid replacements found"))
-                return False
-            
-            # Apply replacements from END to START to avoid position shifting
-            result_chars = list(to_content)
-            for start_pos in sorted(replacements.keys(), reverse=True):
-                end_pos, replacement = replacements[start_pos]
-                result_chars[start_pos:end_pos] = list(replacement)
-            
-            result = ''.join(result_chars)
-            
-            # Safety check: verify basic AST structure remains intact
-            if 'astver' not in result[:200] or 'ast = {' not in result[:300]:
-                self.failed_files.append((to_path.name, "CRITICAL: Output structure corrupted (missing astver/ast)"))
-                return False
+                            unmatched_to.append(to_block.block_id)
+                
+                # Report mismatches if any
+                if unmatched_to or unmatched_from:
+                    mismatch = (len(to_blocks), len(from_blocks), unmatched_to, unmatched_from)
+                
+                if not replacements:
+                    return (to_path.name, False, mismatch, "No valid replacements found", None)
+                
+                # Rebuild output from untouched slices and replacements in order
+                parts = []
+                last_pos = 0
+                for start_pos in sorted(replacements):
+                    end_pos, replacement = replacements[start_pos]
+                    parts.append(to_content[last_pos:start_pos])
+                    parts.append(replacement)
+                    last_pos = end_pos
+                parts.append(to_content[last_pos:])
+                
+                result = _translate_newlines(b''.join(parts))
             
             # Ensure output directory exists
             out_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Write result
-            out_path.write_text(result, encoding='utf-8')
-            self.successful_files.append(to_path.name)
-            return True
+            # Write result; it is already UTF-8 bytes, so no encode pass
+            out_path.write_bytes(result)
+            return (to_path.name, True, mismatch, None, None)
             
         except Exception as e:
             error_msg = f"{type(e).__name__}: {str(e)[:150]}"
-            self.failed_files.append((to_path.name, error_msg))
-            print(f"  ✗ ERROR: {error_msg}")
-            import traceback
-            traceback.print_exc()
-            return False
+            return (to_path.name, False, mismatch, error_msg, traceback.format_exc())
+
+    def record(self, result: FileResult) -> bool:
+        """Add one process_file() result to the reports and queue its status line."""
+        filename, ok, mismatch, error_msg, trace = result
+        log = self.log_lines
+        log.append(f"📄 {filename} ")
+        
+        if mismatch:
+            to_count, from_count, unmatched_to, unmatched_from = mismatch
+            self.mismatched_files.append((filename, to_count, from_count, unmatched_to + unmatched_from))
+            log.append(f"  ⚠ Block mismatch: {len(unmatched_to)} TO blocks unmatched, {len(unmatched_from)} FROM blocks unmatched\n")
+        
+        if trace:
+            log.append(f"  ✗ ERROR: {error_msg}\n")
+            log.append(trace)
+        
+        if ok:
+            self.successful_files.append(filename)
+            log.append("→ ✓ OK\n")
+        else:
+            self.failed_files.append((filename, error_msg))
+            log.append("→ ✗ FAILED\n")
+        return ok
+
+    def flush_log(self):
+        """Write queued status lines in one batch."""
+        if self.log_lines:
+            sys.stdout.writelines(self.log_lines)
+            sys.stdout.flush()
+            self.log_lines.clear()
 
     def write_reports(self, output_folder: Path):
         """Write detailed reports for mismatches and failures."""
@@ -333,6 +457,61 @@ class ASTProcessor:
         
         print(f"✅ Summary saved to: {summary_path.resolve()}")
 
+# Swap in the compiled scanners when ast_scan has been built
+if _ast_scan is not None:
+    ASTProcessor.find_matching_brace = staticmethod(_ast_scan.find_matching_brace)
+    ASTProcessor.transform_names = staticmethod(_ast_scan.transform_names)
+
+def _check_utf8(buf: bytes):
+    """Raise UnicodeDecodeError if buf is not valid UTF-8.
+    
+    Decodes in bounded chunks and discards them, so memory stays flat
+    instead of holding a str copy of the whole file.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')('strict')
+    size = len(buf)
+    for pos in range(0, size, _UTF8_CHECK_CHUNK):
+        decoder.decode(buf[pos:pos + _UTF8_CHECK_CHUNK])
+    decoder.decode(b'', final=True)
+
+def _translate_newlines(data: bytes) -> bytes:
+    """Apply the newline handling read_text()/write_text() used to give.
+    
+    \r\n and \r become \n (universal newlines on read), then \n becomes
+    os.linesep (on write), so spliced-in en sections never mix line endings.
+    """
+    if b'\r' in data:
+        data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    if _LINESEP != b'\n':
+        data = data.replace(b'\n', _LINESEP)
+    return data
+
+@contextmanager
+def _mapped(path: Path) -> Iterator[bytes]:
+    """Memory-map a file read-only for the duration of the block."""
+    with path.open('rb') as f:
+        # Zero-length files cannot be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield mm
+        finally:
+            mm.close()
+
+def _scan_ast_files(folder: Path) -> List[os.DirEntry]:
+    """List the .ast files directly inside folder."""
+    with os.scandir(folder) as entries:
+        return [
+            entry for entry in entries
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() == '.ast'
+        ]
+
+def _process_one(to_path: Path, from_path: Path, out_path: Path) -> FileResult:
+    """Pool worker entry point: process one file pair in a child process."""
+    return ASTProcessor().process_file(to_path, from_path, out_path)
+
 def main():
     if len(sys.argv) != 4:
         script_name = Path(sys.argv[0]).name
@@ -360,11 +539,10 @@ def main():
             print(f"✗ Error: {name} path is not a directory: {folder}")
             sys.exit(1)
     
-    # Get all .ast files
-    to_files = sorted([
-        f for f in to_folder.iterdir() 
-        if f.is_file() and f.suffix.lower() == '.ast'
-    ])
+    # Get all .ast files; one directory listing per folder, using the entry
+    # types scandir already returns instead of a stat call per file
+    to_files = sorted(Path(entry.path) for entry in _scan_ast_files(to_folder))
+    from_names = {os.path.normcase(entry.name) for entry in _scan_ast_files(from_folder)}
     
     if not to_files:
         print(f"✗ No .ast files found in {to_folder}")
@@ -376,24 +554,36 @@ def main():
     print(f"   Output to:   {out_folder.resolve()}\n")
     
     processor = ASTProcessor()
-    success_count = 0
+    has_from = []  # Whether each TO file has a FROM partner, in file order
+    to_paths, from_paths, out_paths = [], [], []
     
     for to_path in to_files:
-        from_path = from_folder / to_path.name
-        out_path = out_folder / to_path.name
-        
-        print(f"📄 {to_path.name}", end=' ')
-        
-        if not from_path.exists():
-            processor.failed_files.append((to_path.name, "No matching file in FROM folder"))
-            print("→ ✗ MISSING FROM FILE")
-            continue
-        
-        if processor.process_file(to_path, from_path, out_path):
-            print("→ ✓ OK")
-            success_count += 1
-        else:
-            print("→ ✗ FAILED")
+        # The name set covers the usual case; on a miss, ask the filesystem as
+        # before, since it may match names case-insensitively (e.g. macOS)
+        found = (os.path.normcase(to_path.name) in from_names
+                 or (from_folder / to_path.name).exists())
+        has_from.append(found)
+        if found:
+            to_paths.append(to_path)
+            from_paths.append(from_folder / to_path.name)
+            out_paths.append(out_folder / to_path.name)
+    
+    # File pairs are independent; process them in parallel across CPU cores
+    # (the default worker count is capped where Windows requires it)
+    success_count = 0
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(_process_one, to_paths, from_paths, out_paths)
+        # Walk the files in order so missing FROM files are reported in
+        # sequence with the pool results, which map() yields in order too
+        for count, (to_path, found) in enumerate(zip(to_files, has_from), 1):
+            if not found:
+                processor.failed_files.append((to_path.name, "No matching file in FROM folder"))
+                processor.log_lines.append(f"📄 {to_path.name} → ✗ MISSING FROM FILE\n")
+            elif processor.record(next(results)):
+                success_count += 1
+            if count % LOG_FLUSH_INTERVAL == 0:
+                processor.flush_log()
+    processor.flush_log()
     
     # Final summary
     print("\n" + "="*70)